@@ -7,12 +7,13 @@
 # Under the Apache 2.0 license. Copyright is held by the authors
 
 """Helper functions and wrapper class for converting between PyTorch and Jax."""
+
 from __future__ import annotations
 
 import functools
 import numbers
 from collections import abc
-from typing import Any, Iterable, Mapping, SupportsFloat, Union
+from typing import Any, Callable, Iterable, Mapping, SupportsFloat, Union
 
 import gymnasium as gym
 from gymnasium.core import RenderFrame, WrapperActType, WrapperObsType
@@ -45,73 +46,195 @@ __all__ = ["JaxToTorch", "jax_to_torch", "torch_to_jax", "Device"]
 # The NoneType is not defined in Python 3.9. Remove when the minimal version is bumped to >=3.10
 _NoneType = type(None)
 
+# Bound once at import so the conversion hot path avoids repeated module attribute lookups
+_JaxArray = jax.Array
+_Tensor = torch.Tensor
+
+
+def _select_dlpack_backends() -> (
+    tuple[Callable[[Any], jax.Array], Callable[[Any], torch.Tensor]]
+):
+    """Selects the Jax and PyTorch DLPack importers for the installed versions, called once on import.
+
+    ``jnp.from_dlpack`` and ``torch.from_dlpack`` consume the producer's ``__dlpack__`` protocol directly,
+    older versions of jax and torch only provide the capsule-based ``dlpack`` module functions.
+    """
+    if hasattr(jnp, "from_dlpack"):
+        jax_from_dlpack = jnp.from_dlpack
+    else:
+        jax_from_dlpack = (
+            jax_dlpack.from_dlpack  # pyright: ignore[reportPrivateImportUsage]
+        )
+
+    if hasattr(torch, "from_dlpack"):
+        torch_from_dlpack = torch.from_dlpack
+    else:
+        torch_from_dlpack = torch_dlpack.from_dlpack
+
+    return jax_from_dlpack, torch_from_dlpack
+
+
+_jax_from_dlpack, _torch_from_dlpack = _select_dlpack_backends()
+
+
+@functools.lru_cache(maxsize=128)
+def _is_namedtuple(value_type: type) -> bool:
+    """Checks if ``value_type`` is a namedtuple, the result is memoized for the most recently used types."""
+    return issubclass(value_type, tuple) and hasattr(value_type, "_fields")
+
 
-@functools.singledispatch
 def torch_to_jax(value: Any) -> Any:
-    """Converts a PyTorch Tensor into a Jax Array."""
-    raise Exception(
-        f"No known conversion for Torch type ({type(value)}) to Jax registered. Report as issue on github."
-    )
+    """Converts a PyTorch Tensor into a Jax Array.
+
+    The handler is looked up by the exact type of ``value`` in ``_TORCH_TO_JAX``, subclasses (i.e., namedtuples)
+    fall back to ``_fallback_torch_to_jax``. Conversions for custom types are added with
+    ``torch_to_jax.register(cls, func)`` or ``@torch_to_jax.register(cls)``.
+    """
+    handler = _TORCH_TO_JAX.get(type(value))
+    if handler is not None:
+        return handler(value)
+    return _fallback_torch_to_jax(value)
 
 
-@torch_to_jax.register(numbers.Number)
 def _number_torch_to_jax(value: numbers.Number) -> Any:
     """Convert a python number (int, float, complex) to a jax array."""
     return jnp.array(value)
 
 
-@torch_to_jax.register(torch.Tensor)
-def _tensor_torch_to_jax(value: torch.Tensor) -> jax.Array:
-    """Converts a PyTorch Tensor into a Jax Array."""
-    return jax_dlpack.from_dlpack(value)  # pyright: ignore[reportPrivateImportUsage]
+# DLPack has a fixed overhead per conversion, therefore, small CPU Tensors are faster to copy through NumPy
+_SMALL_TENSOR_NUMEL = 1024
+
+
+def _tensor_torch_to_jax(
+    value: torch.Tensor, _from_dlpack: Callable[[Any], jax.Array] = _jax_from_dlpack
+) -> jax.Array:
+    """Converts a PyTorch Tensor into a Jax Array.
+
+    Small CPU Tensors (i.e., scalars) are copied through NumPy, otherwise, the Tensor is shared through DLPack.
+    """
+    if value.is_cpu and value.numel() <= _SMALL_TENSOR_NUMEL:
+        try:
+            return jnp.asarray(value.numpy())
+        except (TypeError, RuntimeError):
+            # Tensors that torch cannot export to NumPy, i.e., bfloat16 (TypeError), requiring grad or with the
+            #   conjugate bit set (RuntimeError), are converted through DLPack which raises its own error if it
+            #   cannot export them, the same as for large Tensors
+            return _from_dlpack(value)
+    return _from_dlpack(value)
 
 
-@torch_to_jax.register(abc.Mapping)
 def _mapping_torch_to_jax(value: Mapping[str, Any]) -> Mapping[str, Any]:
     """Converts a mapping of PyTorch Tensors into a Dictionary of Jax Array."""
     return type(value)(**{k: torch_to_jax(v) for k, v in value.items()})
 
 
-@torch_to_jax.register(abc.Iterable)
+def _dict_torch_to_jax(value: dict[str, Any]) -> dict[str, Any]:
+    """Converts a dictionary of PyTorch Tensors into a dictionary of Jax Array.
+
+    As most observation and info dictionaries are flat, Tensor and dictionary values are converted without dispatching.
+    """
+    converted = {}
+    for k, v in value.items():
+        t = type(v)
+        if t is _Tensor:
+            converted[k] = _tensor_torch_to_jax(v)
+        elif t is dict:
+            converted[k] = _dict_torch_to_jax(v)
+        else:
+            converted[k] = torch_to_jax(v)
+    return converted
+
+
 def _iterable_torch_to_jax(value: Iterable[Any]) -> Iterable[Any]:
     """Converts an Iterable from PyTorch Tensors to an iterable of Jax Array."""
-    if hasattr(value, "_make"):
+    if _is_namedtuple(type(value)):
         # namedtuple - underline used to prevent potential name conflicts
         # noinspection PyProtectedMember
-        return type(value)._make(torch_to_jax(v) for v in value)
+        return type(value)._make([torch_to_jax(v) for v in value])
     else:
-        return type(value)(torch_to_jax(v) for v in value)
+        return type(value)([torch_to_jax(v) for v in value])
+
+
+def _list_torch_to_jax(value: list[Any]) -> list[Any]:
+    """Converts a list of PyTorch Tensors to a list of Jax Array."""
+    return [torch_to_jax(v) for v in value]
+
+
+def _tuple_torch_to_jax(value: tuple[Any, ...]) -> tuple[Any, ...]:
+    """Converts a tuple of PyTorch Tensors to a tuple of Jax Array."""
+    return tuple([torch_to_jax(v) for v in value])
 
 
-@torch_to_jax.register(_NoneType)
 def _none_torch_to_jax(value: None) -> None:
     """Passes through None values."""
     return value
 
 
-@functools.singledispatch
-def jax_to_torch(value: Any, device: Device | None = None) -> Any:
-    """Converts a Jax Array into a PyTorch Tensor."""
+def _fallback_torch_to_jax(value: Any) -> Any:
+    """Converts values whose exact type is not in ``_TORCH_TO_JAX``, i.e., subclasses of the supported types."""
+    for registered_type, handler in _registered_torch_to_jax.items():
+        if isinstance(value, registered_type):
+            return handler(value)
+
+    if isinstance(value, _Tensor):
+        return _tensor_torch_to_jax(value)
+    elif isinstance(value, numbers.Number):
+        return _number_torch_to_jax(value)
+    elif isinstance(value, abc.Mapping):
+        return _mapping_torch_to_jax(value)
+    elif isinstance(value, abc.Iterable):
+        return _iterable_torch_to_jax(value)
+
     raise Exception(
-        f"No known conversion for Jax type ({type(value)}) to PyTorch registered. Report as issue on github."
+        f"No known conversion for Torch type ({type(value)}) to Jax registered. Report as issue on github."
     )
 
 
-@jax_to_torch.register(jax.Array)
+_TORCH_TO_JAX: dict[type, Callable[[Any], Any]] = {
+    _Tensor: _tensor_torch_to_jax,
+    dict: _dict_torch_to_jax,
+    tuple: _tuple_torch_to_jax,
+    list: _list_torch_to_jax,
+    _NoneType: _none_torch_to_jax,
+    int: _number_torch_to_jax,
+    float: _number_torch_to_jax,
+    bool: _number_torch_to_jax,
+    complex: _number_torch_to_jax,
+}
+# conversions registered with `torch_to_jax.register`, also used for subclasses of the registered types
+_registered_torch_to_jax: dict[type, Callable[[Any], Any]] = {}
+
+
+def jax_to_torch(value: Any, device: Device | None = None) -> Any:
+    """Converts a Jax Array into a PyTorch Tensor.
+
+    The handler is looked up by the exact type of ``value`` in ``_JAX_TO_TORCH``, subclasses fall back to
+    ``_fallback_jax_to_torch``. Conversions for custom types are added with ``jax_to_torch.register(cls, func)``
+    or ``@jax_to_torch.register(cls)``, where ``func`` takes the value and the device.
+    """
+    handler = _JAX_TO_TORCH.get(type(value))
+    if handler is not None:
+        return handler(value, device)
+    return _fallback_jax_to_torch(value, device)
+
+
 def _devicearray_jax_to_torch(
-    value: jax.Array, device: Device | None = None
+    value: jax.Array,
+    device: Device | None = None,
+    _from_dlpack: Callable[[Any], torch.Tensor] = _torch_from_dlpack,
 ) -> torch.Tensor:
     """Converts a Jax Array into a PyTorch Tensor."""
-    assert jax_dlpack is not None and torch_dlpack is not None
-    tensor = torch_dlpack.from_dlpack(
-        value
-    )  # pyright: ignore[reportPrivateImportUsage]
+    tensor = _from_dlpack(value)
     if device:
-        return tensor.to(device=device)
+        if type(device) is not torch.device:
+            device = torch.device(device)
+        # skip the `to` dispatch if the jax array is already on the requested device (zero-copy)
+        if tensor.device != device:
+            # a non-blocking copy to the host could be read before it has completed
+            return tensor.to(device=device, non_blocking=device.type != "cpu")
     return tensor
 
 
-@jax_to_torch.register(abc.Mapping)
 def _jax_mapping_to_torch(
     value: Mapping[str, Any], device: Device | None = None
 ) -> Mapping[str, Any]:
@@ -119,31 +242,150 @@ def _jax_mapping_to_torch(
     return type(value)(**{k: jax_to_torch(v, device) for k, v in value.items()})
 
 
-@jax_to_torch.register(abc.Iterable)
+def _jax_dict_to_torch(
+    value: dict[str, Any],
+    device: Device | None = None,
+    convert_array: Callable[[jax.Array], torch.Tensor] | None = None,
+) -> dict[str, Any]:
+    """Converts a dictionary of Jax Array into a dictionary of PyTorch Tensors.
+
+    As most observation and info dictionaries are flat, Array and dictionary values are converted without dispatching.
+    ``convert_array`` converts the Array values, by default, with ``_devicearray_jax_to_torch`` to ``device``.
+    """
+    if convert_array is None:
+        if device is None:
+            convert_array = _torch_from_dlpack
+        else:
+            convert_array = functools.partial(_devicearray_jax_to_torch, device=device)
+
+    converted = {}
+    for k, v in value.items():
+        t = type(v)
+        if t in _PASSTHROUGH_TYPES:
+            converted[k] = v
+        elif isinstance(v, _JaxArray):
+            converted[k] = convert_array(v)
+        elif t is dict:
+            converted[k] = _jax_dict_to_torch(v, device, convert_array)
+        else:
+            converted[k] = jax_to_torch(v, device)
+    return converted
+
+
 def _jax_iterable_to_torch(
     value: Iterable[Any], device: Device | None = None
 ) -> Iterable[Any]:
     """Converts an Iterable from Jax Array to an iterable of PyTorch Tensors."""
-    if isinstance(value, jax.Array):
-        # Since the update to jax 0.6.0, calling jax_to_torch with a <class 'jaxlib.xla_extension.ArrayImpl'>
-        # argument wrongly dispatches to _iterable_jax_to_torch which fails with:
-        # TypeError: (): incompatible function arguments.
-        # See: https://github.com/Farama-Foundation/Gymnasium/issues/1360
-        return _devicearray_jax_to_torch(value)
-    elif hasattr(value, "_make"):
+    if _is_namedtuple(type(value)):
         # namedtuple - underline used to prevent potential name conflicts
         # noinspection PyProtectedMember
-        return type(value)._make(jax_to_torch(v, device) for v in value)
+        return type(value)._make([jax_to_torch(v, device) for v in value])
     else:
-        return type(value)(jax_to_torch(v, device) for v in value)
+        return type(value)([jax_to_torch(v, device) for v in value])
+
+
+def _jax_list_to_torch(value: list[Any], device: Device | None = None) -> list[Any]:
+    """Converts a list of Jax Array to a list of PyTorch Tensors."""
+    return [jax_to_torch(v, device) for v in value]
+
+
+def _jax_tuple_to_torch(
+    value: tuple[Any, ...], device: Device | None = None
+) -> tuple[Any, ...]:
+    """Converts a tuple of Jax Array to a tuple of PyTorch Tensors."""
+    return tuple([jax_to_torch(v, device) for v in value])
 
 
-@jax_to_torch.register(_NoneType)
 def _none_jax_to_torch(value: None, device: Device | None = None) -> None:
     """Passes through None values."""
     return value
 
 
+# Python scalars and strings, common in info, have no Jax counterpart so are returned unchanged
+_PASSTHROUGH_TYPES = frozenset({int, float, bool, str, bytes, _NoneType})
+
+
+def _passthrough_jax_to_torch(value: Any, device: Device | None = None) -> Any:
+    """Passes through python scalars and strings."""
+    return value
+
+
+def _fallback_jax_to_torch(value: Any, device: Device | None = None) -> Any:
+    """Converts values whose exact type is not in ``_JAX_TO_TORCH``, i.e., subclasses of the supported types."""
+    for registered_type, handler in _registered_jax_to_torch.items():
+        if isinstance(value, registered_type):
+            return handler(value, device)
+
+    # `jax.Array` is iterable so must be checked before `abc.Iterable`
+    if isinstance(value, _JaxArray):
+        # register the concrete array type such that its next conversion is dispatched directly
+        _JAX_TO_TORCH[type(value)] = _devicearray_jax_to_torch
+        return _devicearray_jax_to_torch(value, device)
+    elif isinstance(value, abc.Mapping):
+        return _jax_mapping_to_torch(value, device)
+    elif isinstance(value, abc.Iterable):
+        return _jax_iterable_to_torch(value, device)
+
+    raise Exception(
+        f"No known conversion for Jax type ({type(value)}) to PyTorch registered. Report as issue on github."
+    )
+
+
+_JAX_TO_TORCH: dict[type, Callable[[Any, Device | None], Any]] = {
+    _JaxArray: _devicearray_jax_to_torch,
+    dict: _jax_dict_to_torch,
+    tuple: _jax_tuple_to_torch,
+    list: _jax_list_to_torch,
+    _NoneType: _none_jax_to_torch,
+    int: _passthrough_jax_to_torch,
+    float: _passthrough_jax_to_torch,
+    bool: _passthrough_jax_to_torch,
+    str: _passthrough_jax_to_torch,
+    bytes: _passthrough_jax_to_torch,
+}
+# `jax.Array` is an abstract base class, the arrays returned by Jax are instances of its subclasses (i.e., `ArrayImpl`).
+#   Since jax 0.6.0, these must be matched before `abc.Iterable` (https://github.com/Farama-Foundation/Gymnasium/issues/1360)
+#   which the exact type lookup guarantees.
+_JAX_TO_TORCH.update(
+    (array_type, _devicearray_jax_to_torch) for array_type in _JaxArray.__subclasses__()
+)
+# conversions registered with `jax_to_torch.register`, also used for subclasses of the registered types
+_registered_jax_to_torch: dict[type, Callable[[Any, Device | None], Any]] = {}
+
+
+def _make_register(
+    handlers: dict[type, Callable[..., Any]], registered: dict[type, Callable[..., Any]]
+) -> Callable[..., Any]:
+    """Creates a ``register`` function, as with :func:`functools.singledispatch`, for the conversion ``handlers``."""
+
+    def register(cls: type, func: Callable[..., Any] | None = None) -> Any:
+        if func is None:
+            return lambda f: register(cls, f)
+
+        handlers[cls] = func
+        registered[cls] = func
+        return func
+
+    return register
+
+
+torch_to_jax.register = _make_register(  # pyright: ignore[reportFunctionMemberAccess]
+    _TORCH_TO_JAX, _registered_torch_to_jax
+)
+jax_to_torch.register = _make_register(  # pyright: ignore[reportFunctionMemberAccess]
+    _JAX_TO_TORCH, _registered_jax_to_torch
+)
+
+
+def _jax_scalar_to_python(value: Any, scalar_type: type) -> Any:
+    """Converts a scalar to ``scalar_type``, reading Jax Arrays from the device with a single ``item`` call."""
+    if type(value) is scalar_type:
+        return value
+    elif isinstance(value, _JaxArray):
+        value = value.item()
+    return scalar_type(value)
+
+
 class JaxToTorch(gym.Wrapper, gym.utils.RecordConstructorArgs):
     """Wraps a Jax-based environment so that it can be interacted with PyTorch Tensors.
 
@@ -153,6 +395,14 @@ class JaxToTorch(gym.Wrapper, gym.utils.RecordConstructorArgs):
     Note:
         For ``rendered`` this is returned as a NumPy array not a pytorch Tensor.
 
+    Note:
+        Converting the reward, termination and truncation to python types requires synchronising with the device
+        the Jax environment runs on. With ``scalar_python_types=False``, they are returned as 0-d torch Tensors.
+
+    Note:
+        With ``reuse_info=True``, the info returned by :meth:`step` is the same dictionary for consecutive steps
+        with the same info keys, whose values are overwritten. Therefore, a copy must be made to store the info.
+
     Example:
         >>> import torch                                                # doctest: +SKIP
         >>> import gymnasium as gym                                     # doctest: +SKIP
@@ -174,41 +424,111 @@ class JaxToTorch(gym.Wrapper, gym.utils.RecordConstructorArgs):
 
     Change logs:
      * v1.0.0 - Initially added
+     * v1.2.0 - Add ``scalar_python_types`` argument to return the reward, termination and truncation as Tensors
+       and ``reuse_info`` argument to reuse the step info dictionary
     """
 
-    def __init__(self, env: gym.Env, device: Device | None = None):
+    def __init__(
+        self,
+        env: gym.Env,
+        device: Device | None = None,
+        scalar_python_types: bool = True,
+        reuse_info: bool = False,
+    ):
         """Wrapper class to change inputs and outputs of environment to PyTorch tensors.
 
         Args:
             env: The Jax-based environment to wrap
             device: The device the torch Tensors should be moved to
+            scalar_python_types: If to return the reward, termination and truncation as python ``float`` and ``bool``,
+                otherwise, Jax Arrays are returned as 0-d torch Tensors
+            reuse_info: If to reuse the step info dictionary between steps with the same info keys, avoiding
+                allocating a new dictionary each step
         """
-        gym.utils.RecordConstructorArgs.__init__(self, device=device)
+        gym.utils.RecordConstructorArgs.__init__(
+            self,
+            device=device,
+            scalar_python_types=scalar_python_types,
+            reuse_info=reuse_info,
+        )
         gym.Wrapper.__init__(self, env)
 
-        self.device: Device | None = device
-
-    def step(
-        self, action: WrapperActType
-    ) -> tuple[WrapperObsType, SupportsFloat, bool, bool, dict]:
+        # parsed once rather than for every converted array
+        self.device: torch.device | None = (
+            torch.device(device) if device is not None else None
+        )
+        self.scalar_python_types = scalar_python_types
+        self.reuse_info = reuse_info
+        self._info_cache: dict[str, Any] | None = None
+
+        # selected once such that converting an array doesn't check for a device
+        self._convert: Callable[[jax.Array], torch.Tensor]
+        if self.device is None:
+            self._convert = _torch_from_dlpack
+        else:
+            self._convert = functools.partial(
+                _devicearray_jax_to_torch, device=self.device
+            )
+
+    def step(self, action: WrapperActType) -> tuple[
+        WrapperObsType,
+        SupportsFloat | torch.Tensor,
+        bool | torch.Tensor,
+        bool | torch.Tensor,
+        dict,
+    ]:
         """Performs the given action within the environment.
 
         Args:
             action: The action to perform as a PyTorch Tensor
 
         Returns:
-            The next observation, reward, termination, truncation, and extra info
+            The next observation, reward, termination, truncation, and extra info. The reward, termination and
+            truncation are python scalars, or PyTorch tensors if ``scalar_python_types`` is ``False``.
         """
         jax_action = torch_to_jax(action)
-        obs, reward, terminated, truncated, info = self.env.step(jax_action)
-
-        return (
-            jax_to_torch(obs, self.device),
-            float(reward),
-            bool(terminated),
-            bool(truncated),
-            jax_to_torch(info, self.device),
-        )
+        return self._convert_step_result(self.env.step(jax_action))
+
+    def _convert_step_result(self, result: tuple[Any, Any, Any, Any, dict]) -> tuple[
+        WrapperObsType,
+        SupportsFloat | torch.Tensor,
+        bool | torch.Tensor,
+        bool | torch.Tensor,
+        dict,
+    ]:
+        """Converts the Jax-based step result to PyTorch in a single pass."""
+        obs, reward, terminated, truncated, info = result
+
+        if self.scalar_python_types:
+            reward = _jax_scalar_to_python(reward, float)
+            terminated = _jax_scalar_to_python(terminated, bool)
+            truncated = _jax_scalar_to_python(truncated, bool)
+        else:
+            reward, terminated, truncated = (
+                self._convert(value) if isinstance(value, _JaxArray) else value
+                for value in (reward, terminated, truncated)
+            )
+
+        # comparing the keys also detects keys added to or removed from the cached info since it was returned
+        info_cache = self._info_cache
+        if info_cache is not None and info_cache.keys() == info.keys():
+            for k, v in info.items():
+                info_cache[k] = self._convert_value(v)
+            info = info_cache
+        else:
+            info = self._convert_value(info)
+            if self.reuse_info and type(info) is dict:
+                self._info_cache = info
+
+        return self._convert_value(obs), reward, terminated, truncated, info
+
+    def _convert_value(self, value: Any) -> Any:
+        """Converts an observation, info or info value from Jax to PyTorch with the converter selected in ``__init__``."""
+        if isinstance(value, _JaxArray):
+            return self._convert(value)
+        elif type(value) is dict:
+            return _jax_dict_to_torch(value, self.device, self._convert)
+        return jax_to_torch(value, self.device)
 
     def reset(
         self, *, seed: int | None = None, options: dict[str, Any] | None = None
@@ -225,7 +545,8 @@ class JaxToTorch(gym.Wrapper, gym.utils.RecordConstructorArgs):
         if options:
             options = torch_to_jax(options)
 
-        return jax_to_torch(self.env.reset(seed=seed, options=options), self.device)
+        obs, info = self.env.reset(seed=seed, options=options)
+        return self._convert_value(obs), self._convert_value(info)
 
     def render(self) -> RenderFrame | list[RenderFrame] | None:
         """Returns the rendered frames as a torch tensor."""
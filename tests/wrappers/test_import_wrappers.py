@@ -1,6 +1,8 @@
 """Test suite for import wrappers."""
 
 import re
+import subprocess
+import sys
 
 import pytest
 
@@ -30,6 +32,15 @@ def test_all_wrappers_shortened(wrapper_name):
         pytest.skip(str(e))
 
 
+def test_import_wrappers_without_jax_and_torch():
+    """Test that importing the wrappers does not import `jax` or `torch` until a conversion wrapper is accessed."""
+    code = (
+        "import sys, gymnasium.wrappers, gymnasium.wrappers.vector; "
+        "assert 'jax' not in sys.modules and 'torch' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
 def test_wrapper_vector():
     assert gymnasium.wrappers.vector is not None
 
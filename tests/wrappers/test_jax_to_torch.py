@@ -1,7 +1,9 @@
 """Test suite for TorchToJax wrapper."""
 
+from collections import OrderedDict
 from typing import NamedTuple
 
+import numpy as np
 import pytest
 
 
@@ -94,6 +96,10 @@ class ExampleNamedTuple(NamedTuple):
                 b=torch.tensor([1.0, 2.0]),
             ),
         ),
+        (
+            OrderedDict(a=torch.tensor([1.0]), b=(torch.tensor(2),)),
+            OrderedDict(a=torch.tensor([1.0]), b=(torch.tensor(2, dtype=torch.int32),)),
+        ),
         (None, None),
     ],
 )
@@ -103,6 +109,101 @@ def test_roundtripping(value, expected_value):
     assert torch_data_equivalence(roundtripped_value, expected_value)
 
 
+def test_register_custom_type():
+    """Test that conversions for custom types can be registered, including for their subclasses."""
+
+    class Wrapped:
+        def __init__(self, value):
+            self.value = value
+
+    class SubWrapped(Wrapped):
+        pass
+
+    @torch_to_jax.register(Wrapped)
+    def _wrapped_torch_to_jax(value):
+        return Wrapped(torch_to_jax(value.value))
+
+    jax_to_torch.register(
+        Wrapped, lambda value, device=None: Wrapped(jax_to_torch(value.value, device))
+    )
+
+    for wrapped_type in (Wrapped, SubWrapped):
+        converted = torch_to_jax(wrapped_type(torch.tensor([1.0, 2.0])))
+        assert type(converted) is Wrapped and isinstance(converted.value, jax.Array)
+
+        roundtripped = jax_to_torch(converted)
+        assert type(roundtripped) is Wrapped
+        assert torch_data_equivalence(roundtripped.value, torch.tensor([1.0, 2.0]))
+
+
+@pytest.mark.parametrize("device", ["cpu", torch.device("cpu")])
+def test_jax_to_torch_same_device(device):
+    """Test that converting to the device the jax array is already on does not copy the data."""
+    value = jnp.array([1.0, 2.0, 3.0])
+    tensor = jax_to_torch(value, device)
+
+    assert tensor.device == torch.device("cpu")
+    assert tensor.data_ptr() == value.unsafe_buffer_pointer()
+
+
+def test_jax_to_torch_passthrough():
+    """Test that python scalars and strings, i.e., within info, are returned unchanged."""
+    info = {"a": 1, "b": 2.0, "c": True, "d": "text", "e": None, "f": jnp.array(3.0)}
+    converted = jax_to_torch(info)
+
+    assert torch_data_equivalence(
+        converted,
+        {"a": 1, "b": 2.0, "c": True, "d": "text", "e": None, "f": torch.tensor(3.0)},
+    )
+    assert jax_to_torch((1, "text")) == (1, "text")
+
+
+def test_torch_to_jax_reused_tensor():
+    """Test that a tensor converted repeatedly, i.e., a reused action, is converted from its current values."""
+    buffer = np.zeros(2, dtype=np.float32)
+    tensor = torch.from_numpy(buffer)
+    assert jnp.array_equal(torch_to_jax(tensor), jnp.array([0.0, 0.0]))
+
+    # modifications that are not tracked by the tensor's version counter
+    buffer[0] = 7.0
+    assert jnp.array_equal(torch_to_jax(tensor), jnp.array([7.0, 0.0]))
+    tensor.data[1] = 5.0
+    assert jnp.array_equal(torch_to_jax(tensor), jnp.array([7.0, 5.0]))
+
+    # tensors created in inference mode don't have a version counter
+    with torch.inference_mode():
+        inference_tensor = torch.tensor([1.0, 2.0])
+    assert jnp.array_equal(torch_to_jax(inference_tensor), jnp.array([1.0, 2.0]))
+    assert jnp.array_equal(torch_to_jax(inference_tensor), jnp.array([1.0, 2.0]))
+
+    # a jitted environment step may donate the converted action
+    donating_step = jax.jit(lambda action: action + 1, donate_argnums=0)
+    assert jnp.array_equal(donating_step(torch_to_jax(tensor)), jnp.array([8.0, 6.0]))
+    assert jnp.array_equal(donating_step(torch_to_jax(tensor)), jnp.array([8.0, 6.0]))
+
+
+def test_torch_to_jax_small_tensor_fallback():
+    """Test that small tensors which cannot be exported to NumPy are converted through DLPack."""
+    array = torch_to_jax(torch.tensor([1.0, 2.0], dtype=torch.bfloat16))
+    assert array.dtype == jnp.bfloat16
+    assert jnp.array_equal(array, jnp.array([1.0, 2.0], dtype=jnp.bfloat16))
+
+    # neither NumPy nor DLPack can export a tensor with the conjugate bit set
+    conj_tensor = torch.tensor([1 + 2j, 3j]).conj()
+    with pytest.raises(BufferError, match="conjugate bit"):
+        torch_to_jax(conj_tensor)
+    assert jnp.array_equal(
+        torch_to_jax(conj_tensor.resolve_conj()), jnp.array([1 - 2j, -3j])
+    )
+
+    # DLPack cannot export tensors that require grad, regardless of their size
+    for numel in (2, 4096):
+        grad_tensor = torch.ones(numel, requires_grad=True)
+        with pytest.raises(BufferError, match="require gradient"):
+            torch_to_jax(grad_tensor)
+        assert jnp.array_equal(torch_to_jax(grad_tensor.detach()), jnp.ones(numel))
+
+
 def _jax_reset_func(self, seed=None, options=None):
     return jnp.array([1.0, 2.0, 3.0]), {"data": jnp.array([1, 2, 3])}
 
@@ -148,3 +249,79 @@ def test_jax_to_torch_wrapper():
     # Check that the wrapped environment can render. This implicitly returns None and requires  a
     # None -> None conversion
     wrapped_env.render()
+
+
+def test_jax_to_torch_wrapper_scalar_tensors():
+    """Tests the `JaxToTorch` wrapper returning the reward, termination and truncation as Tensors."""
+    env = GenericTestEnv(reset_func=_jax_reset_func, step_func=_jax_step_func)
+    wrapped_env = JaxToTorch(env, scalar_python_types=False)
+    wrapped_env.reset()
+
+    obs, reward, terminated, truncated, info = wrapped_env.step(torch.tensor([1, 2]))
+    assert isinstance(obs, torch.Tensor)
+    assert isinstance(reward, torch.Tensor) and reward.shape == ()
+    assert isinstance(terminated, torch.Tensor) and terminated.shape == ()
+    assert isinstance(truncated, torch.Tensor) and truncated.shape == ()
+    assert reward.item() == 5.0 and terminated.item() and not truncated.item()
+    assert isinstance(info, dict) and isinstance(info["data"], torch.Tensor)
+
+
+def test_jax_to_torch_wrapper_device():
+    """Tests that the `JaxToTorch` device is parsed on construction and used for the conversions."""
+    env = GenericTestEnv(reset_func=_jax_reset_func, step_func=_jax_step_func)
+    wrapped_env = JaxToTorch(env, device="cpu")
+    assert wrapped_env.device == torch.device("cpu")
+
+    obs, info = wrapped_env.reset()
+    assert (
+        obs.device == wrapped_env.device and info["data"].device == wrapped_env.device
+    )
+
+    obs, _, _, _, info = wrapped_env.step(torch.tensor([1, 2]))
+    assert (
+        obs.device == wrapped_env.device and info["data"].device == wrapped_env.device
+    )
+
+
+def test_jax_to_torch_wrapper_reuse_info():
+    """Tests that the `JaxToTorch` step info is reused while the info keys are unchanged."""
+    step_count = 0
+
+    def _step_func(self, action):
+        nonlocal step_count
+        step_count += 1
+        info = {"step": jnp.array(step_count)}
+        if step_count == 3:
+            info["extra"] = jnp.array(0)
+        return jnp.array([1, 2, 3]), 0.0, False, False, info
+
+    env = GenericTestEnv(reset_func=_jax_reset_func, step_func=_step_func)
+    wrapped_env = JaxToTorch(env, reuse_info=True)
+    wrapped_env.reset()
+
+    *_, info_1 = wrapped_env.step(torch.tensor([1, 2]))
+    assert info_1["step"].item() == 1
+    *_, info_2 = wrapped_env.step(torch.tensor([1, 2]))
+    assert info_2 is info_1 and info_2["step"].item() == 2
+
+    # the info keys change, therefore, a new info is returned
+    *_, info_3 = wrapped_env.step(torch.tensor([1, 2]))
+    assert info_3 is not info_1 and info_3.keys() == {"step", "extra"}
+    assert info_1["step"].item() == 2 and info_3["step"].item() == 3
+
+
+def test_jax_to_torch_wrapper_reset_options():
+    """Tests that the `JaxToTorch` reset options, including python scalars, are converted to Jax Arrays."""
+
+    def _reset_func(self, seed=None, options=None):
+        assert isinstance(options, dict) and options.keys() == {"a", "b", "c"}
+        assert all(isinstance(value, jax.Array) for value in options.values())
+        return jnp.array([1.0, 2.0, 3.0]), {}
+
+    env = GenericTestEnv(reset_func=_reset_func, step_func=_jax_step_func)
+    wrapped_env = JaxToTorch(env)
+
+    obs, _ = wrapped_env.reset(
+        options={"a": torch.tensor([1.0, 2.0]), "b": 3, "c": 4.0}
+    )
+    assert isinstance(obs, torch.Tensor)